@@ -26,6 +26,8 @@ from abc import ABC, abstractmethod
 from concurrent import futures
 from inspect import iscoroutinefunction
 
+from tenacity import _utils
+
 # Import all built-in retry strategies for easier usage.
 from .retry import retry_base  # noqa
 from .retry import retry_all  # noqa
@@ -51,12 +53,17 @@ from .stop import stop_after_delay  # noqa
 from .stop import stop_all  # noqa
 from .stop import stop_any  # noqa
 from .stop import stop_never  # noqa
+from .stop import stop_when_budget_exhausted  # noqa
 from .stop import stop_when_event_set  # noqa
 
+# Import the retry budget for easier usage.
+from .budget import TokenBucket  # noqa
+
 # Import all built-in wait strategies for easier usage.
 from .wait import wait_chain  # noqa
 from .wait import wait_combine  # noqa
 from .wait import wait_exponential  # noqa
+from .wait import wait_exponential_jitter  # noqa
 from .wait import wait_fixed  # noqa
 from .wait import wait_incrementing  # noqa
 from .wait import wait_none  # noqa
@@ -139,11 +146,11 @@ NO_RESULT = object()
 
 
 class DoAttempt:
-    pass
+    __slots__ = ()
 
 
 class DoSleep(float):
-    pass
+    __slots__ = ()
 
 
 class BaseAction:
@@ -155,6 +162,8 @@ class BaseAction:
     - NAME: for identification in retry object methods and callbacks
     """
 
+    __slots__ = ()
+
     REPR_FIELDS: t.Sequence[str] = ()
     NAME: t.Optional[str] = None
 
@@ -167,6 +176,8 @@ class BaseAction:
 
 
 class RetryAction(BaseAction):
+    __slots__ = ("sleep",)
+
     REPR_FIELDS = ("sleep",)
     NAME = "retry"
 
@@ -234,6 +245,10 @@ class BaseRetrying(ABC):
         reraise: bool = False,
         retry_error_cls: t.Type[RetryError] = RetryError,
         retry_error_callback: t.Optional[t.Callable[["RetryCallState"], t.Any]] = None,
+        cache: t.Optional[t.MutableMapping[t.Hashable, t.Any]] = None,
+        cache_key: t.Callable[[t.Callable[..., t.Any], t.Tuple[t.Any, ...], t.Dict[str, t.Any]], t.Hashable] = (
+            _utils.make_cache_key
+        ),
     ):
         self.sleep = sleep
         self.stop = stop
@@ -246,6 +261,8 @@ class BaseRetrying(ABC):
         self._local = threading.local()
         self.retry_error_cls = retry_error_cls
         self.retry_error_callback = retry_error_callback
+        self.cache = cache
+        self.cache_key = cache_key
 
     def copy(
         self,
@@ -259,6 +276,10 @@ class BaseRetrying(ABC):
         reraise: t.Union[bool, object] = _unset,
         retry_error_cls: t.Union[t.Type[RetryError], object] = _unset,
         retry_error_callback: t.Union[t.Optional[t.Callable[["RetryCallState"], t.Any]], object] = _unset,
+        cache: t.Union[t.Optional[t.MutableMapping[t.Hashable, t.Any]], object] = _unset,
+        cache_key: t.Union[
+            t.Callable[[t.Callable[..., t.Any], t.Tuple[t.Any, ...], t.Dict[str, t.Any]], t.Hashable], object
+        ] = _unset,
     ) -> "BaseRetrying":
         """Copy this object with some parameters changed if needed."""
         return self.__class__(
@@ -272,6 +293,8 @@ class BaseRetrying(ABC):
             reraise=_first_set(reraise, self.reraise),
             retry_error_cls=_first_set(retry_error_cls, self.retry_error_cls),
             retry_error_callback=_first_set(retry_error_callback, self.retry_error_callback),
+            cache=_first_set(cache, self.cache),
+            cache_key=_first_set(cache_key, self.cache_key),
         )
 
     def __repr__(self) -> str:
@@ -332,26 +355,38 @@ class BaseRetrying(ABC):
         return wrapped_f
 
     def begin(self) -> None:
-        self.statistics.clear()
-        self.statistics["start_time"] = time.monotonic()
-        self.statistics["attempt_number"] = 1
-        self.statistics["idle_for"] = 0
+        statistics = self.statistics
+        statistics.clear()
+        statistics["start_time"] = time.monotonic()
+        statistics["attempt_number"] = 1
+        statistics["idle_for"] = 0
 
     def iter(self, retry_state: "RetryCallState") -> t.Union[DoAttempt, DoSleep, t.Any]:  # noqa
         fut = retry_state.outcome
         if fut is None:
+            if self.cache is not None and retry_state.fn is not None and retry_state.attempt_number == 1:
+                key = self.cache_key(retry_state.fn, retry_state.args, retry_state.kwargs)
+                retry_state.result_cache_key = key
+                try:
+                    return self.cache[key]
+                except KeyError:
+                    pass
             if self.before is not None:
                 self.before(retry_state)
             return DoAttempt()
 
-        is_explicit_retry = retry_state.outcome.failed and isinstance(retry_state.outcome.exception(), TryAgain)
+        is_explicit_retry = fut.failed and isinstance(fut.exception(), TryAgain)
         if not (is_explicit_retry or self.retry(retry_state=retry_state)):
-            return fut.result()
+            result = fut.result()
+            if self.cache is not None and retry_state.result_cache_key is not _unset:
+                self.cache[retry_state.result_cache_key] = result
+            return result
 
         if self.after is not None:
             self.after(retry_state)
 
-        self.statistics["delay_since_first_attempt"] = retry_state.seconds_since_start
+        statistics = self.statistics
+        statistics["delay_since_first_attempt"] = retry_state.seconds_since_start
         if self.stop(retry_state=retry_state):
             if self.retry_error_callback:
                 return self.retry_error_callback(retry_state)
@@ -366,8 +401,8 @@ class BaseRetrying(ABC):
             sleep = 0.0
         retry_state.next_action = RetryAction(sleep)
         retry_state.idle_for += sleep
-        self.statistics["idle_for"] += sleep
-        self.statistics["attempt_number"] += 1
+        statistics["idle_for"] += sleep
+        statistics["attempt_number"] += 1
 
         if self.before_sleep is not None:
             self.before_sleep(retry_state)
@@ -400,8 +435,10 @@ class Retrying(BaseRetrying):
         self.begin()
 
         retry_state = RetryCallState(retry_object=self, fn=fn, args=args, kwargs=kwargs)
+        iter_ = self.iter
+        sleep = self.sleep
         while True:
-            do = self.iter(retry_state=retry_state)
+            do = iter_(retry_state=retry_state)
             if isinstance(do, DoAttempt):
                 try:
                     result = fn(*args, **kwargs)
@@ -411,7 +448,7 @@ class Retrying(BaseRetrying):
                     retry_state.set_result(result)
             elif isinstance(do, DoSleep):
                 retry_state.prepare_for_next_attempt()
-                self.sleep(do)
+                sleep(do)
             else:
                 return do
 
@@ -470,6 +507,8 @@ class RetryCallState:
         self.idle_for: float = 0.0
         #: Next action as decided by the retry manager
         self.next_action: t.Optional[RetryAction] = None
+        #: Key of this call in the retry manager's result cache, if it has one
+        self.result_cache_key: t.Any = _unset
 
     @property
     def seconds_since_start(self) -> t.Optional[float]:
@@ -15,10 +15,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import functools
 import sys
 import typing
-from asyncio import sleep
 
 from tenacity import AttemptManager
 from tenacity import BaseRetrying
@@ -30,8 +30,27 @@ WrappedFn = typing.TypeVar("WrappedFn", bound=typing.Callable)
 _RetValT = typing.TypeVar("_RetValT")
 
 
+def _portable_async_sleep(seconds: float) -> typing.Awaitable[None]:
+    """Sleep using the sleep function of the running async library.
+
+    Trio is used when it is the library driving the current task, otherwise
+    asyncio is assumed.
+    """
+    # If trio has not been imported, it cannot be running, so there is no
+    # need to import it (or sniffio) to find out.
+    if "trio" in sys.modules:
+        import sniffio
+        import trio
+
+        if sniffio.current_async_library() == "trio":
+            return trio.sleep(seconds)
+    return asyncio.sleep(seconds)
+
+
 class AsyncRetrying(BaseRetrying):
-    def __init__(self, sleep: typing.Callable[[float], typing.Awaitable] = sleep, **kwargs: typing.Any) -> None:
+    def __init__(
+        self, sleep: typing.Callable[[float], typing.Awaitable] = _portable_async_sleep, **kwargs: typing.Any
+    ) -> None:
         super().__init__(**kwargs)
         self.sleep = sleep
 
@@ -44,8 +63,10 @@ class AsyncRetrying(BaseRetrying):
         self.begin()
 
         retry_state = RetryCallState(retry_object=self, fn=fn, args=args, kwargs=kwargs)
+        iter_ = self.iter
+        sleep = self.sleep
         while True:
-            do = self.iter(retry_state=retry_state)
+            do = iter_(retry_state=retry_state)
             if isinstance(do, DoAttempt):
                 try:
                     result = await fn(*args, **kwargs)
@@ -55,7 +76,7 @@ class AsyncRetrying(BaseRetrying):
                     retry_state.set_result(result)
             elif isinstance(do, DoSleep):
                 retry_state.prepare_for_next_attempt()
-                await self.sleep(do)
+                await sleep(do)
             else:
                 return do
 
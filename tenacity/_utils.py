@@ -66,3 +66,13 @@ def get_callback_name(cb: typing.Callable[..., typing.Any]) -> str:
         except AttributeError:
             pass
         return ".".join(segments)
+
+
+def make_cache_key(
+    fn: typing.Callable[..., typing.Any], args: typing.Tuple[typing.Any, ...], kwargs: typing.Dict[str, typing.Any]
+) -> typing.Hashable:
+    """Build the default result cache key of a retried call.
+
+    The function, positional and keyword arguments must all be hashable.
+    """
+    return fn, args, tuple(sorted(kwargs.items()))
@@ -0,0 +1,50 @@
+# Copyright 2016–2021 Julien Danjou
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import typing
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to cap the rate of retries.
+
+    The bucket starts full with `capacity` tokens and regains `rate` tokens
+    per second, never holding more than `capacity`. Share one bucket between
+    several retrying objects to bound the number of retries they issue
+    together, e.g. to avoid retry storms while a dependency is down.
+    """
+
+    __slots__ = ("_rate", "_capacity", "_tokens", "_last", "_lock")
+
+    def __init__(self, rate: float, capacity: typing.Union[int, float]) -> None:
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> bool:
+        """Take one token from the bucket.
+
+        :return: whether a token was available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
@@ -27,8 +27,11 @@ def sleep(seconds: float) -> None:
     Sleep strategy that delays execution for a given number of seconds.
 
     This is the default strategy, and may be mocked out for unit testing.
+    A zero delay (e.g. with ``wait_none``) returns without calling into
+    :func:`time.sleep`.
     """
-    time.sleep(seconds)
+    if seconds != 0:
+        time.sleep(seconds)
 
 
 class sleep_using_event:
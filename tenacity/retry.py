@@ -185,7 +185,7 @@ class retry_if_not_exception_message(retry_if_exception_message):
         super().__init__(message, match)
         # invert predicate
         if_predicate = self.predicate
-        self.predicate = lambda *args_, **kwargs_: not if_predicate(*args_, **kwargs_)
+        self.predicate = lambda exception: not if_predicate(exception)
 
     def __call__(self, retry_state: "RetryCallState") -> bool:
         if not retry_state.outcome.failed:
@@ -202,6 +202,11 @@ class retry_any(retry_base):
     def __call__(self, retry_state: "RetryCallState") -> bool:
         return any(r(retry_state) for r in self.retries)
 
+    def __or__(self, other: retry_base) -> "retry_any":
+        # Extend this retry_any rather than nesting it so chains like
+        # ``a | b | c`` are checked in a single pass.
+        return retry_any(*self.retries, other)
+
 
 class retry_all(retry_base):
     """Retries if all the retries condition are valid."""
@@ -211,3 +216,6 @@ class retry_all(retry_base):
 
     def __call__(self, retry_state: "RetryCallState") -> bool:
         return all(r(retry_state) for r in self.retries)
+
+    def __and__(self, other: retry_base) -> "retry_all":
+        return retry_all(*self.retries, other)
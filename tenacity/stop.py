@@ -20,11 +20,14 @@ if typing.TYPE_CHECKING:
     import threading
 
     from tenacity import RetryCallState
+    from tenacity.budget import TokenBucket
 
 
 class stop_base(abc.ABC):
     """Abstract base class for stop strategies."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def __call__(self, retry_state: "RetryCallState") -> bool:
         pass
@@ -39,26 +42,40 @@ class stop_base(abc.ABC):
 class stop_any(stop_base):
     """Stop if any of the stop condition is valid."""
 
+    __slots__ = ("stops",)
+
     def __init__(self, *stops: stop_base) -> None:
         self.stops = stops
 
     def __call__(self, retry_state: "RetryCallState") -> bool:
         return any(x(retry_state) for x in self.stops)
 
+    def __or__(self, other: stop_base) -> "stop_any":
+        # Extend this stop_any rather than nesting it so chains like
+        # ``a | b | c`` are checked in a single pass.
+        return stop_any(*self.stops, other)
+
 
 class stop_all(stop_base):
     """Stop if all the stop conditions are valid."""
 
+    __slots__ = ("stops",)
+
     def __init__(self, *stops: stop_base) -> None:
         self.stops = stops
 
     def __call__(self, retry_state: "RetryCallState") -> bool:
         return all(x(retry_state) for x in self.stops)
 
+    def __and__(self, other: stop_base) -> "stop_all":
+        return stop_all(*self.stops, other)
+
 
 class _stop_never(stop_base):
     """Never stop."""
 
+    __slots__ = ()
+
     def __call__(self, retry_state: "RetryCallState") -> bool:
         return False
 
@@ -69,6 +86,8 @@ stop_never = _stop_never()
 class stop_when_event_set(stop_base):
     """Stop when the given event is set."""
 
+    __slots__ = ("event",)
+
     def __init__(self, event: "threading.Event") -> None:
         self.event = event
 
@@ -76,9 +95,30 @@ class stop_when_event_set(stop_base):
         return self.event.is_set()
 
 
+class stop_when_budget_exhausted(stop_base):
+    """Stop when no retry token can be taken from the given budget.
+
+    A token is consumed every time this strategy is evaluated, whatever the
+    outcome of other stop conditions. Place it last in a ``|`` chain so it is
+    only consulted once every other condition allows a retry, and do not use
+    it inside ``&`` (or stop_all), where tokens would be spent on attempts
+    that keep retrying anyway.
+    """
+
+    __slots__ = ("budget",)
+
+    def __init__(self, budget: "TokenBucket") -> None:
+        self.budget = budget
+
+    def __call__(self, retry_state: "RetryCallState") -> bool:
+        return not self.budget.acquire()
+
+
 class stop_after_attempt(stop_base):
     """Stop when the previous attempt >= max_attempt."""
 
+    __slots__ = ("max_attempt_number",)
+
     def __init__(self, max_attempt_number: int) -> None:
         self.max_attempt_number = max_attempt_number
 
@@ -89,6 +129,8 @@ class stop_after_attempt(stop_base):
 class stop_after_delay(stop_base):
     """Stop when the time from the first attempt >= limit."""
 
+    __slots__ = ("max_delay",)
+
     def __init__(self, max_delay: float) -> None:
         self.max_delay = max_delay
 
@@ -43,8 +43,10 @@ class TornadoRetrying(BaseRetrying):
         self.begin()
 
         retry_state = RetryCallState(retry_object=self, fn=fn, args=args, kwargs=kwargs)
+        iter_ = self.iter
+        sleep = self.sleep
         while True:
-            do = self.iter(retry_state=retry_state)
+            do = iter_(retry_state=retry_state)
             if isinstance(do, DoAttempt):
                 try:
                     result = yield fn(*args, **kwargs)
@@ -54,6 +56,6 @@ class TornadoRetrying(BaseRetrying):
                     retry_state.set_result(result)
             elif isinstance(do, DoSleep):
                 retry_state.prepare_for_next_attempt()
-                yield self.sleep(do)
+                yield sleep(do)
             else:
                 raise gen.Return(do)
@@ -27,6 +27,8 @@ if typing.TYPE_CHECKING:
 class wait_base(abc.ABC):
     """Abstract base class for wait strategies."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def __call__(self, retry_state: "RetryCallState") -> float:
         pass
@@ -44,6 +46,8 @@ class wait_base(abc.ABC):
 class wait_fixed(wait_base):
     """Wait strategy that waits a fixed amount of time between each retry."""
 
+    __slots__ = ("wait_fixed",)
+
     def __init__(self, wait: float) -> None:
         self.wait_fixed = wait
 
@@ -54,6 +58,8 @@ class wait_fixed(wait_base):
 class wait_none(wait_fixed):
     """Wait strategy that doesn't wait at all before retrying."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(0)
 
@@ -61,6 +67,8 @@ class wait_none(wait_fixed):
 class wait_random(wait_base):
     """Wait strategy that waits a random amount of time between min/max."""
 
+    __slots__ = ("wait_random_min", "wait_random_max")
+
     def __init__(self, min: typing.Union[int, float] = 0, max: typing.Union[int, float] = 1) -> None:  # noqa
         self.wait_random_min = min
         self.wait_random_max = max
@@ -72,12 +80,19 @@ class wait_random(wait_base):
 class wait_combine(wait_base):
     """Combine several waiting strategies."""
 
+    __slots__ = ("wait_funcs",)
+
     def __init__(self, *strategies: wait_base) -> None:
         self.wait_funcs = strategies
 
     def __call__(self, retry_state: "RetryCallState") -> float:
         return sum(x(retry_state=retry_state) for x in self.wait_funcs)
 
+    def __add__(self, other: wait_base) -> "wait_combine":
+        # Extend this wait_combine rather than nesting it so sums like
+        # ``a + b + c`` are computed in a single pass.
+        return wait_combine(*self.wait_funcs, other)
+
 
 class wait_chain(wait_base):
     """Chain two or more waiting strategies.
@@ -95,6 +110,8 @@ class wait_chain(wait_base):
                    thereafter.")
     """
 
+    __slots__ = ("strategies",)
+
     def __init__(self, *strategies: wait_base) -> None:
         self.strategies = strategies
 
@@ -111,6 +128,8 @@ class wait_incrementing(wait_base):
     (and restricting the upper limit to some maximum value).
     """
 
+    __slots__ = ("start", "increment", "max")
+
     def __init__(
         self,
         start: typing.Union[int, float] = 0,
@@ -139,6 +158,8 @@ class wait_exponential(wait_base):
     wait_random_exponential for the latter case.
     """
 
+    __slots__ = ("multiplier", "min", "max", "exp_base")
+
     def __init__(
         self,
         multiplier: typing.Union[int, float] = 1,
@@ -157,7 +178,7 @@ class wait_exponential(wait_base):
             result = self.multiplier * exp
         except OverflowError:
             return self.max
-        return max(max(0, self.min), min(result, self.max))
+        return max(0, self.min, min(result, self.max))
 
 
 class wait_random_exponential(wait_exponential):
@@ -186,6 +207,45 @@ class wait_random_exponential(wait_exponential):
 
     """
 
+    __slots__ = ()
+
     def __call__(self, retry_state: "RetryCallState") -> float:
         high = super().__call__(retry_state=retry_state)
         return random.uniform(0, high)
+
+
+class wait_exponential_jitter(wait_base):
+    """Wait strategy that applies exponential backoff and jitter.
+
+    The wait time is ``min(initial * exp_base**n + random.uniform(0, jitter),
+    max)`` where n is the retry count. Unlike wait_exponential, concurrent
+    callers retrying on the same schedule are spread out by up to `jitter`
+    seconds, and unlike wait_random_exponential the wait never drops below the
+    exponential backoff itself.
+
+    This implements the strategy described here:
+    https://cloud.google.com/storage/docs/retry-strategy
+    """
+
+    __slots__ = ("initial", "max", "exp_base", "jitter")
+
+    def __init__(
+        self,
+        initial: typing.Union[int, float] = 1,
+        max: typing.Union[int, float] = _utils.MAX_WAIT,  # noqa
+        exp_base: typing.Union[int, float] = 2,
+        jitter: typing.Union[int, float] = 1,
+    ) -> None:
+        self.initial = initial
+        self.max = max
+        self.exp_base = exp_base
+        self.jitter = jitter
+
+    def __call__(self, retry_state: "RetryCallState") -> float:
+        jitter = random.uniform(0, self.jitter)
+        try:
+            exp = self.exp_base ** (retry_state.attempt_number - 1)
+            result = self.initial * exp + jitter
+        except OverflowError:
+            result = self.max
+        return max(0, min(result, self.max))
@@ -18,6 +18,11 @@ import inspect
 import unittest
 from functools import wraps
 
+try:
+    import trio
+except ImportError:
+    trio = None
+
 from tenacity import AsyncRetrying, RetryError
 from tenacity import _asyncio as tasyncio
 from tenacity import retry, stop_after_attempt
@@ -157,5 +162,19 @@ class TestContextManager(unittest.TestCase):
         self.assertLess(t, 1.1)
 
 
+@unittest.skipIf(trio is None, "trio is not installed")
+class TestTrio(unittest.TestCase):
+    def test_retry_using_trio_sleep(self):
+        thing = NoIOErrorAfterCount(2)
+
+        async def trio_function():
+            await trio.sleep(0.00001)
+            return thing.go()
+
+        retrying = AsyncRetrying(wait=wait_fixed(0.00001))
+        trio.run(retrying, trio_function)
+        assert thing.counter == thing.count
+
+
 if __name__ == "__main__":
     unittest.main()
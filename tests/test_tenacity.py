@@ -23,6 +23,7 @@ import warnings
 from contextlib import contextmanager
 from copy import copy
 from fractions import Fraction
+from unittest import mock
 
 import pytest
 
@@ -109,6 +110,39 @@ class TestStopConditions(unittest.TestCase):
         self.assertTrue(s(3, 1.8))
         self.assertTrue(s(4, 1.8))
 
+    def test_stop_when_budget_exhausted(self):
+        stop = tenacity.stop_when_budget_exhausted(tenacity.TokenBucket(rate=0, capacity=2))
+        self.assertFalse(stop(make_retry_state(1, 0)))
+        self.assertFalse(stop(make_retry_state(1, 0)))
+        self.assertTrue(stop(make_retry_state(1, 0)))
+
+    def test_stop_when_budget_exhausted_shared(self):
+        budget = tenacity.TokenBucket(rate=0, capacity=3)
+        calls = []
+
+        @retry(stop=tenacity.stop_when_budget_exhausted(budget))
+        def _always_fail():
+            calls.append(1)
+            raise IOError()
+
+        self.assertRaises(RetryError, _always_fail)
+        self.assertEqual(len(calls), 4)
+        self.assertRaises(RetryError, _always_fail)
+        self.assertEqual(len(calls), 5)
+
+    def test_token_bucket_refills(self):
+        with mock.patch("tenacity.budget.time.monotonic", return_value=100.0) as monotonic:
+            budget = tenacity.TokenBucket(rate=2, capacity=1)
+            self.assertTrue(budget.acquire())
+            self.assertFalse(budget.acquire())
+            monotonic.return_value = 100.25
+            self.assertFalse(budget.acquire())
+            monotonic.return_value = 100.5
+            self.assertTrue(budget.acquire())
+            monotonic.return_value = 200.0
+            self.assertTrue(budget.acquire())
+            self.assertFalse(budget.acquire())
+
     def test_stop_all(self):
         stop = tenacity.stop_all(tenacity.stop_after_delay(1), tenacity.stop_after_attempt(4))
 
@@ -148,6 +182,12 @@ class TestStopConditions(unittest.TestCase):
         self.assertFalse(s(3, 1.8))
         self.assertTrue(s(4, 1.8))
 
+    def test_stop_chains_are_flattened(self):
+        attempt, delay = tenacity.stop_after_attempt(4), tenacity.stop_after_delay(1)
+        never = tenacity.stop_never
+        self.assertEqual((attempt | delay | never).stops, (attempt, delay, never))
+        self.assertEqual((attempt & delay & never).stops, (attempt, delay, never))
+
     def test_stop_after_attempt(self):
         r = Retrying(stop=tenacity.stop_after_attempt(3))
         self.assertFalse(r.stop(make_retry_state(2, 6546)))
@@ -226,6 +266,34 @@ class TestWaitConditions(unittest.TestCase):
         self.assertEqual(r.wait(make_retry_state(7, 0)), 64)
         self.assertEqual(r.wait(make_retry_state(8, 0)), 128)
 
+    def test_exponential_with_large_attempt_numbers(self):
+        r = Retrying(wait=tenacity.wait_exponential(max=2**70))
+        self.assertEqual(r.wait(make_retry_state(64, 0)), 2**63)
+        self.assertEqual(r.wait(make_retry_state(65, 0)), 2**64)
+        self.assertEqual(r.wait(make_retry_state(71, 0)), 2**70)
+        self.assertEqual(r.wait(make_retry_state(100, 0)), 2**70)
+
+    def test_exponential_attributes_changed_after_construction(self):
+        w = tenacity.wait_exponential(max=100)
+        w.max = 5
+        self.assertEqual(w(make_retry_state(5, 0)), 5)
+        w.max = 100
+        w.multiplier = 10
+        self.assertEqual(w(make_retry_state(2, 0)), 20)
+
+    def test_exponential_subclass_without_super_init(self):
+        class wait_doubling(tenacity.wait_exponential):
+            def __init__(self):
+                self.multiplier = 3
+                self.min = 0
+                self.max = 50
+                self.exp_base = 2
+
+        w = wait_doubling()
+        self.assertEqual(w(make_retry_state(1, 0)), 3)
+        self.assertEqual(w(make_retry_state(3, 0)), 12)
+        self.assertEqual(w(make_retry_state(10, 0)), 50)
+
     def test_exponential_with_max_wait(self):
         r = Retrying(wait=tenacity.wait_exponential(max=40))
         self.assertEqual(r.wait(make_retry_state(1, 0)), 1)
@@ -323,6 +391,11 @@ class TestWaitConditions(unittest.TestCase):
             self.assertLess(w, 9)
             self.assertGreaterEqual(w, 6)
 
+    def test_wait_sums_are_flattened(self):
+        waits = [tenacity.wait_fixed(1), tenacity.wait_random(0, 3), tenacity.wait_fixed(5)]
+        self.assertEqual((waits[0] + waits[1] + waits[2]).wait_funcs, tuple(waits))
+        self.assertEqual(sum(waits).wait_funcs, tuple(waits))
+
     def test_wait_arbitrary_sum(self):
         r = Retrying(
             wait=sum(
@@ -392,6 +465,24 @@ class TestWaitConditions(unittest.TestCase):
         self.assertEqual(sleep_intervals, [1.0, 2.0, 3.0, 3.0])
         sleep_intervals[:] = []
 
+    def test_wait_exponential_jitter(self):
+        fn = tenacity.wait_exponential_jitter(initial=0.5, max=60.0, jitter=1)
+
+        for _ in range(1000):
+            self._assert_inclusive_range(fn(make_retry_state(1, 0)), 0.5, 1.5)
+            self._assert_inclusive_range(fn(make_retry_state(2, 0)), 1.0, 2.0)
+            self._assert_inclusive_range(fn(make_retry_state(3, 0)), 2.0, 3.0)
+            self._assert_inclusive_range(fn(make_retry_state(7, 0)), 32.0, 33.0)
+            self._assert_inclusive_range(fn(make_retry_state(8, 0)), 60.0, 60.0)
+            self._assert_inclusive_range(fn(make_retry_state(100, 0)), 60.0, 60.0)
+
+        fn = tenacity.wait_exponential_jitter(jitter=0)
+        self.assertEqual(fn(make_retry_state(4, 0)), 8)
+        self.assertNotIsInstance(fn, tenacity.wait_exponential)
+
+        fn.initial = 3
+        self.assertEqual(fn(make_retry_state(2, 0)), 6)
+
     def test_wait_random_exponential(self):
         fn = tenacity.wait_random_exponential(0.5, 60.0)
 
@@ -541,6 +632,11 @@ class TestRetryConditions(unittest.TestCase):
         self.assertFalse(r(tenacity.Future.construct(1, 3, False)))
         self.assertFalse(r(tenacity.Future.construct(1, 1, True)))
 
+    def test_retry_chains_are_flattened(self):
+        retries = [tenacity.retry_if_result(lambda x: x == i) for i in range(3)]
+        self.assertEqual((retries[0] | retries[1] | retries[2]).retries, tuple(retries))
+        self.assertEqual((retries[0] & retries[1] & retries[2]).retries, tuple(retries))
+
     def test_retry_or(self):
         retry = tenacity.retry_if_result(lambda x: x == "foo") | tenacity.retry_if_result(lambda x: isinstance(x, int))
 
@@ -1287,6 +1383,75 @@ class TestRetryErrorCallback(unittest.TestCase):
         self.assertIsInstance(result, tenacity.Future)
 
 
+class TestResultCache(unittest.TestCase):
+    def test_cache_hit_skips_call(self):
+        cache = {}
+        calls = []
+        thing = NoIOErrorAfterCount(2)
+
+        @retry(cache=cache)
+        def _go(key):
+            calls.append(key)
+            return thing.go()
+
+        self.assertTrue(_go("a"))
+        self.assertEqual(calls, ["a", "a", "a"])
+        self.assertEqual(len(cache), 1)
+        self.assertTrue(_go("a"))
+        self.assertEqual(calls, ["a", "a", "a"])
+        self.assertTrue(_go("b"))
+        self.assertEqual(calls, ["a", "a", "a", "b"])
+
+    def test_cache_ignores_rejected_results(self):
+        cache = {}
+
+        @retry(
+            cache=cache,
+            stop=tenacity.stop_after_attempt(2),
+            retry=tenacity.retry_if_result(lambda result: result is None),
+            retry_error_callback=lambda retry_state: retry_state.outcome.result(),
+        )
+        def _return_none():
+            return None
+
+        self.assertIsNone(_return_none())
+        self.assertEqual(cache, {})
+
+    def test_cache_key(self):
+        cache = {}
+        calls = []
+        keys = []
+
+        def cache_key(fn, args, kwargs):
+            keys.append(args[0])
+            return args[0]
+
+        @retry(cache=cache, cache_key=cache_key)
+        def _double(x, verbose=False):
+            calls.append(x)
+            return x * 2
+
+        self.assertEqual(_double(2), 4)
+        self.assertEqual(_double(2, verbose=True), 4)
+        self.assertEqual(calls, [2])
+        self.assertEqual(keys, [2, 2])
+        self.assertEqual(cache, {2: 4})
+
+    def test_cache_key_errors_propagate(self):
+        calls = []
+
+        @retry(cache={}, cache_key=lambda fn, args, kwargs: kwargs["id"])
+        def _fetch(**kwargs):
+            calls.append(kwargs)
+            return True
+
+        self.assertRaises(KeyError, _fetch)
+        self.assertEqual(calls, [])
+        self.assertTrue(_fetch(id=1))
+        self.assertTrue(_fetch(id=1))
+        self.assertEqual(calls, [{"id": 1}])
+
+
 class TestContextManager(unittest.TestCase):
     def test_context_manager_retry_one(self):
         from tenacity import Retrying
@@ -1502,6 +1667,18 @@ class TestMockingSleep:
             fail_faster()
         assert mock_sleep.call_count == 1
 
+    def test_no_wait_skips_sleep(self, mock_sleep):
+        fail_without_waiting = self._decorated_fail.retry_with(
+            wait=tenacity.wait_none(),
+        )
+        with pytest.raises(RetryError):
+            fail_without_waiting()
+        assert mock_sleep.call_count == 0
+
+    def test_negative_wait_is_rejected(self):
+        with pytest.raises(ValueError):
+            tenacity.nap.sleep(-1)
+
 
 if __name__ == "__main__":
     unittest.main()